@@ -36,8 +36,7 @@ class RouterInUse(nexception.InUse):
     message = _("Router %(router_id)s %(reason)s")
 
     def __init__(self, **kwargs):
-        if 'reason' not in kwargs:
-            kwargs['reason'] = "still has ports"
+        kwargs.setdefault('reason', "still has ports")
         super(RouterInUse, self).__init__(**kwargs)
 
 
@@ -162,6 +161,10 @@ RESOURCE_ATTRIBUTE_MAP = {
     },
 }
 
+_PLURAL_MAPPINGS = {ROUTERS: 'router', FLOATINGIPS: FLOATINGIP}
+_ACTION_MAP = {'router': {'add_router_interface': 'PUT',
+                          'remove_router_interface': 'PUT'}}
+
 # Register the configuration options
 quota.register_quota_opts(quota.l3_quota_opts)
 
@@ -189,14 +192,10 @@ class L3(extensions.ExtensionDescriptor):
     @classmethod
     def get_resources(cls):
         """Returns Ext Resources."""
-        plural_mappings = resource_helper.build_plural_mappings(
-            {}, RESOURCE_ATTRIBUTE_MAP)
-        action_map = {'router': {'add_router_interface': 'PUT',
-                                 'remove_router_interface': 'PUT'}}
-        return resource_helper.build_resource_info(plural_mappings,
+        return resource_helper.build_resource_info(_PLURAL_MAPPINGS,
                                                    RESOURCE_ATTRIBUTE_MAP,
                                                    constants.L3_ROUTER_NAT,
-                                                   action_map=action_map,
+                                                   action_map=_ACTION_MAP,
                                                    register_quota=True)
 
     def update_attributes_map(self, attributes):